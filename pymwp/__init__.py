@@ -50,14 +50,34 @@ __conditions__ = (
 # flake8: noqa: F401,E402
 from pymwp.version import __version__
 from pymwp.constants import *  # import all types
-from pymwp.parser import Parser
-from pymwp.choice import Choices
-from pymwp.syntax import Coverage, Variables, FindLoops
-from pymwp.monomial import Monomial
-from pymwp.delta_graphs import DeltaGraph
-from pymwp.polynomial import Polynomial
-from pymwp.relation import Relation
-from pymwp.relation_list import RelationList
-from pymwp.bound import Bound, MwpBound
-from pymwp.result import Result, FuncResult, FuncLoops, LoopResult, VResult
-from pymwp.analysis import Analysis, LoopAnalysis
+
+# the analysis classes are imported on first access (PEP 562), so that
+# the command line can show help or version without loading pycparser
+_LAZY = {
+    'Parser': 'parser',
+    'Choices': 'choice',
+    'Coverage': 'syntax', 'Variables': 'syntax', 'FindLoops': 'syntax',
+    'Monomial': 'monomial',
+    'DeltaGraph': 'delta_graphs',
+    'Polynomial': 'polynomial',
+    'Relation': 'relation',
+    'RelationList': 'relation_list',
+    'Bound': 'bound', 'MwpBound': 'bound',
+    'Result': 'result', 'FuncResult': 'result', 'FuncLoops': 'result',
+    'LoopResult': 'result', 'VResult': 'result',
+    'Analysis': 'analysis', 'LoopAnalysis': 'analysis',
+}
+
+
+def __getattr__(name):
+    """Import an analysis class from its module on first access."""
+    if name not in _LAZY:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    from importlib import import_module
+    value = getattr(import_module(f'{__name__}.{_LAZY[name]}'), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -24,10 +24,12 @@ Provides command line interface to executing pymwp analysis with arguments.
 This method enables executing MWP analysis through command line.
 
 If user has installed pymwp through pip, this will be the entry point
-of that command when calling:  `pymwp c/file/path --args`
+of that command when calling:  `pymwp c/file/path [...] --args`
 
 The command behavior is to run the analysis on the specified file,
-applying the optional flags.
+applying the optional flags. When multiple files are specified, they
+are analyzed in parallel, one file per process, and each result is saved
+to its default output file.
 
 The available arguments are specified below in `_parse_args` -method.
 
@@ -37,15 +39,88 @@ output can be muted by specifying command line argument `--silent`.
 """
 
 import argparse
+import atexit
 import logging
+import os
+import queue
+import shlex
 import sys
+import time
 from argparse import RawTextHelpFormatter
-from typing import List, Optional, Type, Union
+from concurrent.futures import as_completed
+from logging.handlers import QueueHandler, QueueListener
+from typing import List, Optional, Tuple, Type, Union
 
 from . import __version__, __title__ as pymwp
 from . import __notice__, __warranty__, __conditions__
-from . import Parser, Result, Analysis, LoopAnalysis
-from .file_io import default_file_out, loc, save_result
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that formats each wall-clock second only once.
+
+    Records logged within the same second reuse the previous timestamp
+    string. The cache is a single tuple, so it stays consistent when the
+    formatter is shared between the stream handler and the log file
+    listener thread.
+    """
+
+    def __init__(self, fmt: str, datefmt: str):
+        super().__init__(fmt, datefmt=datefmt)
+        self._cached: Tuple[int, str] = (-1, '')
+
+    def formatTime(self, record: logging.LogRecord,
+                   datefmt: Optional[str] = None) -> str:
+        second = int(record.created)
+        cached_second, text = self._cached
+        if second != cached_second:
+            text = time.strftime(
+                datefmt or self.datefmt, self.converter(second))
+            self._cached = (second, text)
+        return text
+
+
+__LOG_FORMATTERS = {
+    False: _CachedTimeFormatter(
+        "[%(asctime)s] %(levelname)s (%(module)s): %(message)s",
+        datefmt="%H:%M:%S"),
+    True: logging.Formatter(
+        "%(levelname)s (%(module)s): %(message)s")
+}
+"""Log formatters, keyed by whether timestamps are hidden."""
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """File handler that buffers records instead of flushing each one.
+
+    The stream is flushed for warnings and errors, when `flush_interval`
+    seconds have passed since the previous flush, and when the handler
+    is closed at exit.
+    """
+
+    buffer_size = 65536
+    flush_interval = 30
+
+    def __init__(self, filename: str, mode: str = 'a'):
+        self._last_flush = 0.0
+        super().__init__(filename, mode)
+
+    def _open(self):
+        return open(self.baseFilename, self.mode,
+                    buffering=self.buffer_size, encoding=self.encoding)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.WARNING or \
+                    record.created - self._last_flush >= self.flush_interval:
+                self.flush()
+                self._last_flush = record.created
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
 
 def main():
@@ -57,6 +132,7 @@ def main():
 
     if args.license:
         import shutil
+        from . import Result
         shell_size = shutil.get_terminal_size((50, 20))
         text = __conditions__ if args.license == 'C' else __warranty__
         print(Result.pretty_print(text, shell_size.columns - 5))
@@ -66,41 +142,156 @@ def main():
         parser.print_help()
         sys.exit(1)
 
+    if args.out and len(args.input_file) > 1:
+        parser.error('--out cannot be used with multiple input files')
+
+    # multiple files are already analyzed in parallel, one per process
+    if args.workers and args.workers > 1 and len(args.input_file) > 1:
+        parser.error('--workers cannot be used with multiple input files')
+
+    # parallel workers must not race to write the same output file
+    if len(args.input_file) > 1 and not args.no_save:
+        from .file_io import default_file_out
+        outputs = [default_file_out(f) for f in args.input_file]
+        clashes = sorted({f for f in outputs if outputs.count(f) > 1})
+        if clashes:
+            parser.error('input files would be saved to the same output: '
+                         + ', '.join(clashes))
+
+    # report a missing input file as a usage error
+    for input_file in args.input_file:
+        try:
+            os.stat(input_file)
+        except OSError as err:
+            parser.error(str(err))
+
     # setup logger
-    level = 0 if args.silent else 30 if args.info else 40
-    __setup_logger(logging.FATAL - level, args.logfile, args.no_time)
-
-    # get parser args then get AST
-    parser_kwargs = {'use_cpp': not args.no_cpp}
-    if not args.no_cpp:  # only when use_cpp is True
-        parser_kwargs['cpp_path'] = args.cpp_path
-        parser_kwargs['cpp_args'] = args.cpp_args
-    c_headers = args.headers.split(',') if args.headers else None
-    ast = Parser.parse(args.input_file, c_headers, **(parser_kwargs or {}))
-
-    # setup arguments
-    result = Result()
-    result.program.program_path = args.input_file
-    result.program.n_lines = loc(args.input_file)
-    result.color = args.color
-
-    analyzer: Type[Union[Analysis, LoopAnalysis]] = \
-        LoopAnalysis if args.mode == 'L' else Analysis
-    result = analyzer.run(ast, result, fin=args.fin, strict=args.strict)
+    level = logging.CRITICAL if args.silent else \
+        logging.INFO if args.info else logging.DEBUG
+    __setup_logger(level, args.logfile, args.no_time)
+
+    if len(args.input_file) == 1:
+        __analyze(args.input_file[0], args)
+    elif not __analyze_parallel(args.input_file, args):
+        sys.exit(1)
+
+
+def __analyze(input_file: str, args: argparse.Namespace) -> None:
+    """Run analysis on one input file and save the result.
+
+    Arguments:
+        input_file: C source code file to analyze.
+        args: Parsed program arguments.
+    """
+    # analysis modules are only needed past this point
+    from . import Parser, Result, Analysis, LoopAnalysis
+    from .file_io import default_file_out, loc, save_result, \
+        cache_dir, cache_key
+
+    result, cache_file = None, None
+    if args.cache:
+        key = cache_key(
+            input_file, args.mode, args.fin, args.strict, args.no_cpp,
+            args.cpp_path, args.cpp_args, args.headers, __version__)
+        cache_file = os.path.join(cache_dir(), f'{key}.json')
+        result = __load_cached(cache_file, args.color)
+
+    if result is None:
+        # get parser args then get AST
+        parser_kwargs = {'use_cpp': not args.no_cpp}
+        if not args.no_cpp:  # only when use_cpp is True
+            parser_kwargs['cpp_path'] = args.cpp_path
+            parser_kwargs['cpp_args'] = args.cpp_args
+        c_headers = args.headers.split(',') if args.headers else None
+        ast = Parser.parse(input_file, c_headers, **(parser_kwargs or {}))
+
+        # setup arguments
+        result = Result()
+        result.program.program_path = input_file
+        result.program.n_lines = loc(input_file)
+        result.color = args.color
+
+        analyzer: Type[Union[Analysis, LoopAnalysis]] = \
+            LoopAnalysis if args.mode == 'L' else Analysis
+        result = analyzer.run(ast, result, fin=args.fin, strict=args.strict,
+                              workers=args.workers)
+
+        if cache_file:
+            save_result(cache_file, result)
 
     if not args.no_save:
-        file_out = args.out or default_file_out(args.input_file)
+        file_out = args.out or default_file_out(input_file)
         save_result(file_out, result)
 
 
+def __analyze_parallel(input_files: List[str],
+                       args: argparse.Namespace) -> bool:
+    """Analyze multiple input files in a pool of worker processes.
+
+    Workers send their log records back to this process, where they
+    are emitted by the handlers configured for the program logger.
+
+    Arguments:
+        input_files: C source code files to analyze.
+        args: Parsed program arguments.
+
+    Returns:
+        True if every file was analyzed successfully.
+    """
+    from . import Analysis
+
+    logger = logging.getLogger(pymwp)
+    success = True
+    workers = min(len(input_files), os.cpu_count() or 1)
+    with Analysis.worker_pool(workers) as pool:
+        futures = {pool.submit(__analyze, input_file, args): input_file
+                   for input_file in input_files}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception:
+                logger.exception('%s: analysis failed', futures[future])
+                success = False
+    return success
+
+
+def __load_cached(cache_file: str, color: bool = False):
+    """Restore and display a previously cached analysis result.
+
+    Arguments:
+        cache_file: Path to cached result.
+        color: Display important output in color.
+
+    Returns:
+        Restored result, or `None` if the cache has no usable entry.
+    """
+    from . import Result
+    from .file_io import load_result
+
+    if not os.path.isfile(cache_file):
+        return None
+    try:
+        result = load_result(cache_file)
+        if result.program is None:
+            raise ValueError('incomplete result')
+    except (OSError, ValueError, TypeError, KeyError) as err:
+        logging.getLogger(pymwp).warning(
+            'ignoring unreadable cache entry %s: %s', cache_file, err)
+        return None
+    result.color = color
+    for value in [*result.relations.values(), *result.loops.values()]:
+        Result.pretty_print(str(value), color=color)
+    return result.log_result()
+
+
 def __parse_args(
         parser: argparse.ArgumentParser, args: Optional[List] = None
 ) -> argparse.Namespace:
     """Setup available program arguments."""
     parser.add_argument(
         'input_file',
-        help="C source code file to analyze",
-        nargs="?"
+        help="C source code file(s) to analyze",
+        nargs="*"
     )
     parser.add_argument(
         '-v', "--version",
@@ -150,6 +341,20 @@ def __parse_args(
         action='store_true',
         help="enforce input file must be syntax-compliant"
     )
+    analysis.add_argument(
+        "--cache",
+        action='store_true',
+        help="reuse previous result if input file is unchanged;\n"
+             "results are cached in $XDG_CACHE_HOME/pymwp\n"
+             "[default: ~/.cache/pymwp]"
+    )
+    analysis.add_argument(
+        "--workers",
+        action='store',
+        type=int,
+        metavar="N",
+        help="analyze functions in N parallel processes (one input file)"
+    )
 
     compiler = parser.add_argument_group('C compiler options')
     compiler.add_argument(
@@ -163,6 +368,7 @@ def __parse_args(
         '--cpp_args',
         action='store',
         default='-E',
+        type=shlex.split,
         metavar="ARGS",
         help='pre-processor arguments [default: -E]',
     )
@@ -219,23 +425,46 @@ def __setup_logger(
         level: Describe the severity level of the logs to handle.
             see: https://docs.python.org/3/library/logging.html#levels
         log_filename: Write logging info to a file
-    """
-    fmt = "%(levelname)s (%(module)s): %(message)s" if hide_time else \
-        "[%(asctime)s] %(levelname)s (%(module)s): %(message)s"
-    date_fmt = "%H:%M:%S"
-    formatter = logging.Formatter(fmt, datefmt=date_fmt)
+        hide_time: Omit timestamps from log records.
 
+    Calling this function again replaces, rather than duplicates, the
+    previously installed handlers.
+    """
     logger = logging.getLogger(pymwp)
     logger.setLevel(level)
 
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+        listener = getattr(handler, 'listener', None)
+        if listener is not None:
+            atexit.unregister(listener.stop)
+            listener.stop()
+            for file_handler in listener.handlers:
+                file_handler.close()
+        handler.close()
+
+    # nothing will be emitted; skip building handlers
+    if level >= logging.CRITICAL and log_filename is None:
+        logger.addHandler(logging.NullHandler())
+        return
+
+    formatter = __LOG_FORMATTERS[hide_time]
     stream_handler = logging.StreamHandler()
     stream_handler.setFormatter(formatter)
     logger.addHandler(stream_handler)
 
+    # file writes happen on a listener thread, off the analysis path
     if log_filename is not None:
-        file_handler = logging.FileHandler(log_filename)
+        file_handler = _BufferedFileHandler(log_filename)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(
+            log_queue, file_handler, respect_handler_level=True)
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.listener = listener
+        logger.addHandler(queue_handler)
+        listener.start()
+        atexit.register(listener.stop)
 
 
 if __name__ == '__main__':
@@ -17,7 +17,13 @@
 # -----------------------------------------------------------------------------
 
 import logging
-from typing import List, Tuple, Dict
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, nullcontext
+from itertools import repeat
+from logging.handlers import QueueHandler, QueueListener
+from typing import List, Tuple, Dict, Optional, Iterator
 
 from . import Coverage, Variables, FindLoops, COM_RES
 from . import DeltaGraph, Polynomial, RelationList, Relation, Bound, Choices
@@ -28,11 +34,58 @@ from .semiring import ZERO_MWP, UNIT_MWP, POLY_MWP, WEAK_MWP
 
 logger = logging.getLogger(__name__)
 
+_ONE = pr.Constant('int', 1)
+"""Shared constant operand of rewritten increments; never modified."""
+
+
+def _body(node: pr.Node) -> List[pr.Node]:
+    """Statements of a block, or the node itself if it is not a block."""
+    if isinstance(node, pr.Compound):
+        return node.block_items or []
+    return [node]
+
 
 class Analysis:
     """MWP analysis implementation."""
 
-    DOMAIN = [0, 1, 2]
+    DOMAIN = (0, 1, 2)
+
+    _variables: Dict[int, Tuple[pr.Node, List[str]]] = {}
+    """Variables of function and loop nodes, keyed by node id.
+
+    Each entry keeps its node, so a reused id is never mistaken for a hit.
+    """
+
+    _loops: Dict[int, Tuple[pr.Node, List[pr.LoopT]]] = {}
+    """Loops of function nodes, keyed by node id."""
+
+    _compat: Dict[int, Tuple[pr.For, Tuple[bool, Optional[str]]]] = {}
+    """mwp-loop compatibility of for loops, keyed by node id."""
+
+    HANDLERS: Dict[type, str] = {
+        pr.Return: 'skip', pr.Break: 'skip', pr.Continue: 'skip',
+        pr.EmptyStatement: 'skip', pr.Decl: 'skip',
+        pr.Assignment: 'assignment', pr.UnaryOp: 'unary_op',
+        pr.If: 'if_stmt', pr.While: 'while_loop', pr.DoWhile: 'while_loop',
+        pr.For: 'for_loop', pr.Compound: 'compound',
+        pr.FuncCall: 'func_call'}
+    """Name of the method that analyzes each type of AST node."""
+
+    VECTORS: Dict[Tuple[str, bool], Tuple[Tuple[str, ...], ...]] = {
+        ('*', True): ((WEAK_MWP, WEAK_MWP, WEAK_MWP),),
+        ('*', False): ((WEAK_MWP, WEAK_MWP, WEAK_MWP),
+                       (WEAK_MWP, WEAK_MWP, WEAK_MWP)),
+        **{(op, True): ((POLY_MWP, POLY_MWP, WEAK_MWP),)
+           for op in ('+', '-')},
+        **{(op, False): ((UNIT_MWP, POLY_MWP, WEAK_MWP),
+                         (POLY_MWP, UNIT_MWP, WEAK_MWP))
+           for op in ('+', '-')}}
+    """Scalars of the operand polynomials of `x = y (op) z`, by operator
+    and whether `y == z`."""
+
+    CONST_VECTOR: Tuple[Tuple[str, ...], ...] = \
+        ((UNIT_MWP, UNIT_MWP, UNIT_MWP),)
+    """Scalars of the operand polynomial when `y` or `z` is a constant."""
 
     @staticmethod
     def run(ast: pr.Node, res: Result = None, fin: bool = False,
@@ -45,21 +98,57 @@ class Analysis:
             fin (bool): Always run to completion.
             strict (bool): Require supported syntax.
 
+        Keyword Arguments:
+            workers (int): Analyze functions in this many parallel
+                processes; by default functions are analyzed sequentially.
+
         Returns:
             Analysis Result object.
         """
         result: Result = res or Result()
+        Analysis.clear_caches()
         Analysis.take_counts(ast, result)
         logger.debug("started analysis")
         result.on_start()
-        for f_node in [f for f in ast if pr.is_func(f)]:
-            if Analysis.syntax_check(f_node, strict):
-                func_res = Analysis.func(f_node, not fin)
-                func_res.func_code = pr.to_c(f_node, True)
+        funcs = [f for f in ast if pr.is_func(f)
+                 and Analysis.syntax_check(f, strict)]
+        workers = min(kwargs.get('workers') or 1, len(funcs))
+        with Analysis.worker_pool(workers) if workers > 1 \
+                else nullcontext() as pool:
+            func_results = (pool.map if pool else map)(
+                Analysis.func, funcs, repeat(not fin))
+            for f_node, func_res in zip(funcs, func_results):
+                func_res.func_code = sys.intern(pr.to_c(f_node, True))
                 result.add_relation(func_res)
         result.on_end().log_result()
         return result
 
+    @staticmethod
+    @contextmanager
+    def worker_pool(workers: int) -> Iterator[ProcessPoolExecutor]:
+        """Pool of worker processes for analyzing independent nodes.
+
+        Log records of the workers are forwarded to the loggers of this
+        process.
+
+        Arguments:
+            workers: number of worker processes
+
+        Yields:
+            Process pool executor.
+        """
+        log_queue = multiprocessing.Queue()
+        listener = QueueListener(log_queue, _LogForwarder())
+        listener.start()
+        level = logging.getLogger(__package__).getEffectiveLevel()
+        try:
+            with ProcessPoolExecutor(
+                    max_workers=workers, initializer=_init_worker,
+                    initargs=(log_queue, level)) as pool:
+                yield pool
+        finally:
+            listener.stop()
+
     @staticmethod
     def func(node: pr.FuncDef, stop: bool) -> FuncResult:
         """Analyze a function.
@@ -73,40 +162,43 @@ class Analysis:
         """
         assert pr.is_func(node)
         name = node.decl.name
-        logger.info(f"Analyzing {name}")
+        logger.info("Analyzing %s", name)
         result = FuncResult(name).on_start()
 
         # setup for function analysis
-        variables, body = Variables(node).vars, (node.body.block_items or [])
+        variables = Analysis.variables(node)
+        body = node.body.block_items or []
         relations = RelationList.identity(variables=variables)
         total, num_v = len(body), len(variables)
         show_vars = ', '.join(variables) if num_v <= 5 else num_v
-        logger.debug(f"{name} variables: {show_vars}")
-        logger.debug(f"{total} top-level commands to analyze")
+        logger.debug("%s variables: %s", name, show_vars)
+        logger.debug("%d top-level commands to analyze", total)
 
         # analyze body commands
         delta_infty, index = Analysis.cmds(relations, 0, body, stop)
+        first = relations.first
 
-        # evaluate choices + calculate a bound
-        evaluated, choices, bound = False, None, None
-        if not delta_infty:
-            choices = relations.first.eval(Analysis.DOMAIN, index)
-            if not choices.infinite:
-                bound = Bound().calculate(
-                    relations.first.apply_choice(*choices.first))
-            evaluated = True
+        # evaluate choices + calculate a bound;
         # infinite by delta graph or by choice
-        infinite = delta_infty or (evaluated and choices.infinite)
+        choices, bound = None, None
+        if delta_infty:
+            infinite = True
+        else:
+            choices = first.eval(Analysis.DOMAIN, index)
+            infinite = choices.infinite
+            if not infinite:
+                bound = Bound().calculate(
+                    first.apply_choice(*choices.first))
 
         # record results
         result.index = index
         result.infinite = infinite
-        result.variables = relations.first.variables
+        result.variables = first.variables
         if not (infinite and stop):
-            result.relation = relations.first
+            result.relation = first
         if infinite and not stop:
-            var_choices = relations.first.var_eval(Analysis.DOMAIN, index)
-            result.inf_flows = relations.first.infty_pairs(
+            var_choices = first.var_eval(Analysis.DOMAIN, index)
+            result.inf_flows = first.infty_pairs(
                 [v for v, c in var_choices.items() if c.infinite])
         if not infinite:
             result.bound = bound
@@ -132,14 +224,14 @@ class Analysis:
             return False, index
         delta_infty, total, dg = False, len(nodes), DeltaGraph()
         for i, node in enumerate(nodes):
-            logger.debug(f'computing relation...{i} of {total}')
+            logger.debug('computing relation...%d of %d', i, total)
             index, rel_list, delta_infty_ = Analysis \
                 .compute_relation(index, node, dg)
             delta_infty = delta_infty or delta_infty_  # cannot erase
             if stop and delta_infty:
                 logger.debug('delta_graphs: infinite -> Exit now')
                 break
-            logger.debug(f'computing composition...{i} of {total}')
+            logger.debug('computing composition...%d of %d', i, total)
             relations.composition(rel_list)
         return delta_infty, index
 
@@ -157,13 +249,70 @@ class Analysis:
         name = node.decl.name if pr.is_func(node) else 'node'
         cover = Coverage(node).report()
         if not cover.full and strict:
-            logger.warning(f"{name} syntax is not fully analyzable")
+            logger.warning("%s syntax is not fully analyzable", name)
             return False
         if not cover.full:
             cover.ast_mod()  # removes unsupported commands
-            logger.warning(f"{name} syntax was modified")
+            Analysis.clear_caches()
+            logger.warning("%s syntax was modified", name)
         return True
 
+    @staticmethod
+    def clear_caches() -> None:
+        """Forget computed node variables, loops, and loop compatibility.
+
+        These must be recomputed after the AST is modified.
+        """
+        Analysis._variables.clear()
+        Analysis._loops.clear()
+        Analysis._compat.clear()
+
+    @staticmethod
+    def variables(node: pr.Node) -> List[str]:
+        """Get variables of a function or loop node.
+
+        Arguments:
+            node (pr.Node): AST node.
+
+        Returns:
+            List of variables, computed once for each node.
+        """
+        cached = Analysis._variables.get(id(node))
+        if cached is None or cached[0] is not node:
+            cached = Analysis._variables[id(node)] = node, Variables(node).vars
+        return cached[1]
+
+    @staticmethod
+    def loops(node: pr.FuncDef) -> List[pr.LoopT]:
+        """Get loops of a function node.
+
+        Arguments:
+            node (pr.FuncDef): AST function node.
+
+        Returns:
+            List of loops, computed once for each node.
+        """
+        cached = Analysis._loops.get(id(node))
+        if cached is None or cached[0] is not node:
+            cached = Analysis._loops[id(node)] = node, FindLoops(node).loops
+        return cached[1]
+
+    @staticmethod
+    def loop_compat(node: pr.For) -> Tuple[bool, Optional[str]]:
+        """Check if a for loop is compatible with an mwp-loop.
+
+        Arguments:
+            node (pr.For): AST for loop node.
+
+        Returns:
+            Result of `Coverage.loop_compat`, computed once for each node.
+        """
+        cached = Analysis._compat.get(id(node))
+        if cached is None or cached[0] is not node:
+            cached = Analysis._compat[id(node)] = \
+                node, Coverage.loop_compat(node)
+        return cached[1]
+
     @staticmethod
     def take_counts(ast: pr.Node, result: Result) -> None:
         """Calculate program statistics: functions, loops, and variables.
@@ -173,9 +322,9 @@ class Analysis:
             result (Result): Pre-initialized result object.
         """
         fs = [f for f in ast if pr.is_func(f)]
-        ls = [x for xs in [FindLoops(f).loops for f in fs] for x in xs]
-        f_variables = [len(Variables(fn).vars) for fn in fs]
-        l_variables = [len(Variables(lp).vars) for lp in ls]
+        ls = [x for xs in [Analysis.loops(f) for f in fs] for x in xs]
+        f_variables = [len(Analysis.variables(fn)) for fn in fs]
+        l_variables = [len(Analysis.variables(lp)) for lp in ls]
         result.program.n_func = len(fs)
         result.program.n_loops = len(ls)
         result.program.n_func_vars = sum(f_variables)
@@ -195,12 +344,36 @@ class Analysis:
             Updated index value, relation list, and an exit flag.
         """
         logger.debug("in compute_relation")
-        if isinstance(node, (
-                pr.Return, pr.Break, pr.Continue,
-                pr.EmptyStatement, pr.Decl)):  # => skip
-            return index, RelationList(), False
-        if isinstance(node, pr.Assignment) and \
-                isinstance(node.lvalue, pr.ID):
+        handler = Analysis.HANDLERS.get(type(node))
+        if handler:
+            return getattr(Analysis, handler)(index, node, dg)
+        return Analysis.ignore(index, node)
+
+    @staticmethod
+    def skip(index: int, *_) -> COM_RES:
+        """Statement that has no effect on data flow."""
+        return index, RelationList(), False
+
+    @staticmethod
+    def ignore(index: int, node: pr.Node, *_) -> COM_RES:
+        """Report unsupported statement, then ignore it."""
+        Analysis._unsupported(node)
+        return index, RelationList(), False
+
+    @staticmethod
+    def assignment(index: int, node: pr.Assignment, dg: DeltaGraph) \
+            -> COM_RES:
+        """Analyze an assignment, based on the type of its right side.
+
+        Arguments:
+            index (int): Delta index.
+            node (pr.Assignment): Assignment AST node.
+            dg (DeltaGraph): DeltaGraph instance.
+
+        Returns:
+            Updated index value, relation list, and an exit flag.
+        """
+        if isinstance(node.lvalue, pr.ID):
             rvalue = node.rvalue.expr if isinstance(
                 node.rvalue, pr.Cast) else node.rvalue
             if isinstance(rvalue, pr.BinaryOp):
@@ -211,23 +384,15 @@ class Analysis:
                 return Analysis.unary_asgn(index, node, dg)
             if isinstance(rvalue, pr.ID):
                 return Analysis.id(index, node)
-        if isinstance(node, pr.UnaryOp):
-            return Analysis.unary_op(index, node)
-        if isinstance(node, pr.If):
-            return Analysis.if_stmt(index, node, dg)
-        if isinstance(node, (pr.While, pr.DoWhile)):
-            return Analysis.while_loop(index, node, dg)
-        if isinstance(node, pr.For):
-            return Analysis.for_loop(index, node, dg)
-        if isinstance(node, pr.Compound):
-            return Analysis.compound(index, node, dg)
-        if (isinstance(node, pr.FuncCall)
-                and isinstance(node.name, pr.ID)
-                and (node.name.name in ('assert', 'assume'))):
-            return index, RelationList(), False
+        return Analysis.ignore(index, node)
 
-        Analysis._unsupported(pr.to_c(node))
-        return index, RelationList(), False
+    @staticmethod
+    def func_call(index: int, node: pr.FuncCall, *_) -> COM_RES:
+        """Analyze a function call; only assert and assume are allowed."""
+        if isinstance(node.name, pr.ID) and \
+                node.name.name in ('assert', 'assume'):
+            return Analysis.skip(index)
+        return Analysis.ignore(index, node)
 
     @staticmethod
     def id(index: int, node: pr.Assignment) -> COM_RES:
@@ -248,8 +413,7 @@ class Analysis:
             return index, RelationList(), False
 
         x, y = node.lvalue.name, node.rvalue.name
-        vars_list = [[x], [y]]
-        logger.debug(f'Computing relation {x} = {y}')
+        logger.debug('Computing relation %s = %s', x, y)
 
         # create a vector of polynomials based on operator type
         #     x   y
@@ -257,8 +421,7 @@ class Analysis:
         # y | m   m    because x != y
         vector = [Polynomial('o'), Polynomial('m')]
 
-        variables = vars_list[0] + vars_list[1]
-        rel_list = RelationList.identity(variables)
+        rel_list = RelationList.identity([x, y])
         rel_list.replace_column(vector, x)
         return index, rel_list, False
 
@@ -282,19 +445,33 @@ class Analysis:
         assert isinstance(y, (pr.Constant, pr.ID))
         assert isinstance(z, (pr.Constant, pr.ID))
 
-        non_constants = tuple([
-            v.name if hasattr(v, 'name') else None
-            for v in [x, y, z]])
+        x, y, z = (getattr(v, 'name', None) for v in (x, y, z))
+        return Analysis.operation(index, node.rvalue.op, x, y, z)
+
+    @staticmethod
+    def operation(index: int, op: str, x: Optional[str], y: Optional[str],
+                  z: Optional[str]) -> COM_RES:
+        """Analyze `x = y (op) z` given the names of its operands.
+
+        Arguments:
+            index: delta index
+            op: operator
+            x: name of the assigned variable
+            y: name of left operand, or `None` if constant
+            z: name of right operand, or `None` if constant
 
+        Returns:
+            Updated index value, relation list, and an exit flag.
+        """
+        non_constants = (x, y, z)
         # create a vector of polynomials based on operator type
-        index, vector = Analysis.create_vector(
-            index, node.rvalue.op, non_constants)
+        index, vector = Analysis.create_vector(index, op, non_constants)
         # build a list of unique variables but maintain order
         variables = list(dict.fromkeys(non_constants))
         # create relation list
         rel_list = RelationList.identity(variables)
-        if hasattr(x, 'name'):
-            rel_list.replace_column(vector, x.name)
+        if x is not None:
+            rel_list.replace_column(vector, x)
 
         return index, rel_list, False
 
@@ -333,7 +510,6 @@ class Analysis:
         """
         logger.debug('Computing Relation: unary')
         tgt, right, op = node.lvalue, node.rvalue.expr, node.rvalue.op
-        init = f'{pr.to_c(node, True)} ==> '
         new_node = None
 
         if isinstance(right, pr.Constant):
@@ -346,10 +522,11 @@ class Analysis:
                 snd = pr.Assignment('=', tgt, pr.ID(r_name))
                 cmds = [fst, snd] if op in Coverage.PREFIX else [snd, fst]
                 new_node = pr.Compound(cmds)
-            if op == Coverage.MINUS:  # flips sign
-                neg_1 = pr.Constant('int', -1)
-                r_node = pr.BinaryOp(Coverage.MULT, pr.ID(r_name), neg_1)
-                new_node = pr.Assignment('=', tgt, r_node)
+            if op == Coverage.MINUS:  # flips sign: x = y * -1
+                logger.debug('%s = -%s ==> %s = %s * -1',
+                             tgt.name, r_name, tgt.name, r_name)
+                return Analysis.operation(
+                    index, Coverage.MULT, tgt.name, r_name, None)
             if op == Coverage.PLUS:  # does nothing
                 new_node = pr.Assignment('=', tgt, pr.ID(r_name))
 
@@ -360,14 +537,16 @@ class Analysis:
             new_node = pr.Assignment('=', tgt, pr.Constant('int', 64))
 
         if new_node:
-            logger.debug(f'{init}{pr.to_c(new_node, True)}')
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug('%s ==> %s', pr.to_c(node, True),
+                             pr.to_c(new_node, True))
             return Analysis.compute_relation(index, new_node, dg)
 
-        Analysis._unsupported(pr.to_c(node))
+        Analysis._unsupported(node)
         return index, RelationList(), False
 
     @staticmethod
-    def unary_op(index: int, node: pr.UnaryOp) -> COM_RES:
+    def unary_op(index: int, node: pr.UnaryOp, *_) -> COM_RES:
         """Analyze a standalone unary operation.
 
         Arguments:
@@ -379,8 +558,9 @@ class Analysis:
         """
         expr = Analysis.rm_cast(node.expr)
         if node.op in Coverage.INC_DEC and isinstance(expr, pr.ID):
-            node_ = Analysis.rewrite_id_inc_dec(node)
-            return Analysis.binary_op(index, node_)
+            # x++ is x = x + 1, without building the rewritten node
+            return Analysis.operation(
+                index, node.op[-1], expr.name, expr.name, None)
         # could be recursive unary...
         # others operators do nothing without assignment.
         return index, RelationList(), False
@@ -390,10 +570,10 @@ class Analysis:
         """Converts unary ++/-- operators to binary: x = x (op) 1."""
         expr = Analysis.rm_cast(node.expr)
         new_op, name = node.op[-1], expr.name
-        const_1 = pr.Constant('int', 1)
-        rvalue = pr.BinaryOp(new_op, pr.ID(name), const_1)
+        rvalue = pr.BinaryOp(new_op, pr.ID(name), _ONE)
         node_ = pr.Assignment('=', pr.ID(name), rvalue)
-        logger.debug(f'{pr.to_c(node)} rewrite to {pr.to_c(node_)}')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('%s rewrite to %s', pr.to_c(node), pr.to_c(node_))
         return node_
 
     @staticmethod
@@ -453,8 +633,7 @@ class Analysis:
             Updated index value, relation list, and an exit flag.
         """
         if node is not None:
-            for child in (node.block_items or []) \
-                    if hasattr(node, 'block_items') else [node]:
+            for child in _body(node):
                 index, rel_list, exit_ = Analysis \
                     .compute_relation(index, child, dg)
                 if exit_:
@@ -477,8 +656,7 @@ class Analysis:
         logger.debug("analysing while")
 
         relations = RelationList()
-        for child in node.stmt.block_items \
-                if hasattr(node, 'block_items') else [node.stmt]:
+        for child in _body(node.stmt):
             index, rel_list, exit_ = Analysis.compute_relation(
                 index, child, dg)
             if exit_:
@@ -504,12 +682,11 @@ class Analysis:
         Returns:
             Updated index value, relation list, and an exit flag.
         """
-        comp, x_var = Coverage.loop_compat(node)
+        comp, x_var = Analysis.loop_compat(node)
         if not comp:
             return index, RelationList(), False
         relations = RelationList(variables=[x_var])
-        for child in node.stmt.block_items \
-                if hasattr(node, 'block_items') else [node.stmt]:
+        for child in _body(node.stmt):
             index, rel_list, exit_ = Analysis.compute_relation(
                 index, child, dg)
             if exit_:
@@ -539,13 +716,12 @@ class Analysis:
         """
         relations = RelationList()
 
-        if node.block_items:
-            for node in node.block_items:
-                index, rel_list, exit_ = Analysis.compute_relation(
-                    index, node, dg)
-                relations.composition(rel_list)
-                if exit_:
-                    return index, relations, True
+        for child in _body(node):
+            index, rel_list, exit_ = Analysis.compute_relation(
+                index, child, dg)
+            relations.composition(rel_list)
+            if exit_:
+                return index, relations, True
         return index, relations, False
 
     @staticmethod
@@ -570,46 +746,43 @@ class Analysis:
         """
         assert op in Coverage.BIN_OPS
         x, y, z = variables
-        vector = []
 
         # when left variable does not occur on right side of assignment
         # x = … (if x not in …), i.e. when left side variable does not
         # occur on the right side of assignment, we prepend 0 to vector
-        if x != y and x != z:
-            vector.append(Polynomial(ZERO_MWP))
-
-        if y is None or z is None:
-            vector.append(Polynomial.from_scalars(
-                index, UNIT_MWP, UNIT_MWP, UNIT_MWP))
-
-        elif op == '*' and y == z:
-            vector.append(Polynomial.from_scalars(
-                index, WEAK_MWP, WEAK_MWP, WEAK_MWP))
-
-        elif op == '*' and y != z:
-            vector.append(Polynomial.from_scalars(
-                index, WEAK_MWP, WEAK_MWP, WEAK_MWP))
-            vector.append(Polynomial.from_scalars(
-                index, WEAK_MWP, WEAK_MWP, WEAK_MWP))
+        vector = [Polynomial(ZERO_MWP)] if x != y and x != z else []
 
-        elif op in {'+', '-'} and y == z:
-            vector.append(Polynomial.from_scalars(
-                index, POLY_MWP, POLY_MWP, WEAK_MWP))
-
-        elif op in {'+', '-'} and y != z:
-            vector.append(Polynomial.from_scalars(
-                index, UNIT_MWP, POLY_MWP, WEAK_MWP))
-            vector.append(Polynomial.from_scalars(
-                index, POLY_MWP, UNIT_MWP, WEAK_MWP))
+        scalars = Analysis.CONST_VECTOR if y is None or z is None \
+            else Analysis.VECTORS[op, y == z]
+        vector.extend(Polynomial.from_scalars(index, *s) for s in scalars)
 
         return index + 1, vector
 
     @staticmethod
-    def _unsupported(command: any):
+    def _unsupported(node: pr.Node):
         """Keep for debugging extending parser+syntax support."""
+        if not logger.isEnabledFor(logging.WARNING):
+            return
         warning, endc = '\033[93m', '\033[0m'
-        fmt_str = str(command or "").strip()
-        logger.warning(f'{warning}Unsupported syntax {fmt_str}{endc}')
+        fmt_str = (pr.to_c(node) if node is not None else "").strip()
+        logger.warning('%sUnsupported syntax %s%s', warning, fmt_str, endc)
+
+
+class _LogForwarder(logging.Handler):
+    """Hands log records received from worker processes to the logger
+    that created them."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        logging.getLogger(record.name).handle(record)
+
+
+def _init_worker(log_queue: multiprocessing.Queue,
+                 level: Optional[int] = None) -> None:
+    """Send log records of a worker process to the parent process."""
+    package_logger = logging.getLogger(__package__)
+    package_logger.handlers = [QueueHandler(log_queue)]
+    package_logger.propagate = False
+    package_logger.setLevel(level or logging.NOTSET)
 
 
 class LoopAnalysis(Analysis):
@@ -625,10 +798,24 @@ class LoopAnalysis(Analysis):
             res (Result): Pre-initialized result object.
             strict (bool): Require supported syntax.
 
+        Keyword Arguments:
+            workers (int): Analyze loops in this many parallel processes;
+                by default loops are analyzed sequentially.
+
         Returns:
             Analysis Result object.
         """
+        workers = kwargs.get('workers') or 1
+        with Analysis.worker_pool(workers) if workers > 1 \
+                else nullcontext() as pool:
+            return LoopAnalysis._run(ast, res, strict, pool)
+
+    @staticmethod
+    def _run(ast: pr.Node, res: Optional[Result], strict: bool,
+             pool: Optional[ProcessPoolExecutor]) -> Result:
+        """Run loop analysis, inspecting loops in pool if one is given."""
         result = res or Result()
+        Analysis.clear_caches()
         Analysis.take_counts(ast, result)
         logger.debug("Starting loop analysis")
         result.on_start()
@@ -636,14 +823,14 @@ class LoopAnalysis(Analysis):
             f_name = func.decl.name
             f_result = FuncLoops(f_name)
             f_result.on_start()
-            logger.info(f"Analyzing {f_name}")
+            logger.info("Analyzing %s", f_name)
             # find loops and check/fix loop body syntax
             # nested loops are duplicated+lifted
-            loops = [loop for loop in FindLoops(func).loops if
+            loops = [loop for loop in Analysis.loops(func) if
                      LoopAnalysis.syntax_check(loop, strict)]
-            logger.debug(f"Total analyzable loops: {len(loops)}")
-            for loop in loops:
-                f_result.loops.append(LoopAnalysis.inspect(loop))
+            logger.debug("Total analyzable loops: %d", len(loops))
+            f_result.loops.extend((pool.map if pool else map)(
+                LoopAnalysis.inspect, loops))
             f_result.on_end()
             result.add_loop(f_result)
         result.on_end()
@@ -664,21 +851,21 @@ class LoopAnalysis(Analysis):
         result = LoopResult(pr.to_c(node)).on_start()
 
         # setup for loop analysis
-        relations = RelationList.identity(variables=Variables(node).vars)
+        relations = RelationList.identity(
+            variables=Analysis.variables(node))
 
         # analyze body commands, always run to completion
         infty, index = LoopAnalysis.cmds(relations, 0, [node], stop=False)
 
         # lame fix because of #148
-        infty = infty or relations.first.eval(Analysis.DOMAIN, index).infinite
+        first = relations.first
+        infty = infty or first.eval(Analysis.DOMAIN, index).infinite
 
         # evaluate at variables
-        variables = relations.first.variables
-        result.variables = dict(zip(variables, map(
-            lambda v: LoopAnalysis.get_result(
-                relations.first, index, v), variables))) \
-            if not infty else \
-            LoopAnalysis.maybe_result(relations.first, index)
+        result.variables = dict(
+            (v, LoopAnalysis.get_result(first, index, v))
+            for v in first.variables) if not infty else \
+            LoopAnalysis.maybe_result(first, index)
 
         result.on_end()
         return result
@@ -714,13 +901,11 @@ class LoopAnalysis(Analysis):
                    ('is_w', (POLY_MWP,)),
                    ('is_p', ()))
         # find the "least bound-choice": 0/m < has w < has p
-        for attr, scalars in options:
-            choices = relation.var_eval(
-                Analysis.DOMAIN, index, v_name, *scalars)
-            if not choices.infinite:
-                setattr(result, attr, True)
-                result.choices = choices
-                break
+        found = relation.classify_var(
+            Analysis.DOMAIN, index, v_name, [s for _, s in options])
+        if found:
+            pos, result.choices = found
+            setattr(result, options[pos][0], True)
         assert result.choices
         simple_mat = relation.apply_choice(*result.choices.first)
         result.bound = Bound().calculate(simple_mat).bound_dict[v_name]
@@ -738,21 +923,24 @@ class LoopAnalysis(Analysis):
             Dictionary of results, for each variable in relation.
         """
         variables = relation.variables
-        p_bounds = dict(zip(variables, map(lambda v: relation.var_eval(
-            Analysis.DOMAIN, index, v), variables)))
-        fail = [v for v, c in p_bounds.items() if c.infinite]
-        rest = dict([(v, p_bounds[v]) for v in (set(variables) - set(fail))])
-        result = dict([(v, VResult(v)) for v in fail])
-        fail_idx = [relation.variables.index(v) for v in fail]
-        if rest:  # maybe some well-behaving variables?
-            red = Choices.choice_reduce(*rest.values())
-            assert not red.infinite  # should always give a choice?
-            simple_mat = relation.apply_choice(*red.first)
-            for v in rest.keys():
-                idx = relation.variables.index(v)
-                # assumption: if dep is 0, it is 0 in all derivations?
-                deps = set([simple_mat.matrix[fi][idx] for fi in fail_idx])
-                # only when variable has no dependency on failing ones
-                result[v] = (LoopAnalysis.get_result(relation, index, v)
-                             if deps == {ZERO_MWP} else VResult(v))
+        p_bounds = relation.var_eval(Analysis.DOMAIN, index, variables)
+        fail = [v for v in variables if p_bounds[v].infinite]
+        result = dict((v, VResult(v)) for v in fail)
+        if len(fail) == len(variables):
+            return result
+        # maybe some well-behaving variables?
+        rest = [v for v in variables if not p_bounds[v].infinite]
+        red = Choices.choice_reduce(*(p_bounds[v] for v in rest))
+        assert not red.infinite  # should always give a choice?
+        simple_mat = relation.apply_choice(*red.first)
+        fail_rows = [simple_mat.matrix[i] for i, v in enumerate(variables)
+                     if p_bounds[v].infinite]
+        for idx, v in enumerate(variables):
+            if p_bounds[v].infinite:
+                continue
+            # assumption: if dep is 0, it is 0 in all derivations?
+            deps = set(row[idx] for row in fail_rows)
+            # only when variable has no dependency on failing ones
+            result[v] = (LoopAnalysis.get_result(relation, index, v)
+                         if deps == {ZERO_MWP} else VResult(v))
         return result
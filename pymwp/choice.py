@@ -101,9 +101,9 @@ class Choices:
             True if the given choices can be made without infinity.
         """
         for vector in self.valid:
-            if len(choices) <= len(vector) and False not in \
-                    [value in vector[idx] for idx, value in
-                     enumerate(choices)]:
+            if len(choices) <= len(vector) and all(
+                    value in options
+                    for value, options in zip(choices, vector)):
                 return True
         return False
 
@@ -144,9 +144,10 @@ class Choices:
 
         # now only min unique paths that lead to infinity remain
         # only sorted here for presentation purposes
-        paths = [str(list(i)) for i in sorted(
-            list(sequences), key=lambda x: (len(x), x))]
-        logger.debug(f'infinity paths: {" # ".join(paths)}')
+        if logger.isEnabledFor(logging.DEBUG):
+            paths = [str(list(i)) for i in sorted(
+                list(sequences), key=lambda x: (len(x), x))]
+            logger.debug('infinity paths: %s', ' # '.join(paths))
 
         # build vectors representing valid choices
         valid = Choices.build_choices(domain, index, sequences)
@@ -185,25 +186,33 @@ class Choices:
     @staticmethod
     def _reduce(
             domain: List[int], sequences: Set[SEQ],
-            sub_eq: Callable[[SEQ, SEQ], bool], get_: Callable[[SEQ], int],
+            key_: Callable[[SEQ], tuple], get_: Callable[[SEQ], int],
             keep_: Callable[[SEQ], SEQ]
     ) -> bool:
         """Implement sequence reduction from select direction.
 
+        Sequences that are equal except for the choice at one end share
+        the same key; they are bucketed by key once, so that finding all
+        sub-equal sequences of some sequence is a single lookup.
+
         Arguments:
             domain: list of valid per index choices, e.g. `[0, 1, 2]`.
             sequences: set of delta sequences.
-            sub_eq: subsequence comparison function.
+            key_: sub-sequence comparison key, equal for two sequences
+                exactly when they are sub-equal.
             get_: choice value getter, e.g., first or last value of sequence.
             keep_: getter for sub-sequence that should be preserved.
 
          Returns:
             True if a reduction occurred and False otherwise.
         """
+        buckets = {}
+        for s2 in sequences:
+            buckets.setdefault(key_(s2), set()).add(get_(s2))
+        all_choices = set(domain)
         for s1 in [s for s in sequences if len(s) > 1]:
-            subs = [get_(s2) for s2 in sequences if sub_eq(s1, s2)]
             # all paths must exist
-            if set(subs) == set(domain):
+            if buckets[key_(s1)] == all_choices:
                 # keep rest of sequence
                 keep = keep_(s1)
                 # remove all sequences contained by the shorter path
@@ -240,7 +249,7 @@ class Choices:
                 repeated any further.
         """
         return Choices._reduce(
-            domain, sequences, Choices.sub_equal,
+            domain, sequences, key_=lambda s: (s[0][1], s[1:]),
             get_=lambda s2: s2[0][0], keep_=lambda s1: s1[1:])
 
     @staticmethod
@@ -266,7 +275,7 @@ class Choices:
             True if a reduction occurred and False otherwise.
         """
         return Choices._reduce(
-            domain, sequences, Choices.sub_equal_end,
+            domain, sequences, key_=lambda s: (s[-1][1], s[:-1]),
             get_=lambda s2: s2[-1][0], keep_=lambda s1: s1[:-1])
 
     @staticmethod
@@ -337,36 +346,6 @@ class Choices:
             if set(match).issubset(set(item)):
                 items.remove(item)
 
-    @staticmethod
-    def sub_equal(first: SEQ, second: SEQ) -> bool:
-        """Compare two delta sequences for equality, except their 0th value.
-
-        Arguments:
-            first: first delta sequence.
-            second: second delta sequence.
-
-        Returns:
-            True if two delta sequences are equal excluding the 0th value,
-                and False otherwise.
-        """
-        return first[0][1] == second[0][1] and first[1:] == second[1:]
-
-    @staticmethod
-    def sub_equal_end(first: SEQ, second: SEQ) -> bool:
-        """Compare two delta sequences for equality, except their N-th
-        value. This is like `sub_equal`, but comparison is done at the end of
-        sequences.
-
-        Arguments:
-            first: first delta sequence.
-            second: second delta sequence.
-
-        Returns:
-            True if two delta sequences are equal excluding the N-th
-                value, and False otherwise.
-        """
-        return first[-1][1] == second[-1][1] and first[:-1] == second[:-1]
-
     @staticmethod
     def prod(values: list) -> int:
         """Compute the product of numeric list.
@@ -417,7 +396,7 @@ class Choices:
 
         # the product of path lengths gives the max number of distinct vectors
         max_ = Choices.prod(lens)
-        logger.debug(f'maximum distinct vectors: {max_}')
+        logger.debug('maximum distinct vectors: %d', max_)
 
         # noinspection PyTypeChecker
         # number of times each delta occurs in remaining paths
@@ -438,9 +417,9 @@ class Choices:
             # this is same as taking cross product of deltas
             deltas = [sorted_infty[i][v] for i, v in enumerate(indices)]
 
-            idx_freq = [i for v, i in set(deltas)]
-            is_valid = all([idx_freq.count(n) < len(domain)
-                            for n in set(idx_freq)])
+            # number of distinct choices eliminated at each index
+            idx_freq = Counter(i for v, i in set(deltas))
+            is_valid = max(idx_freq.values()) < len(domain)
             # This iteration will not produce a valid vector if all choices
             # are eliminated at some index.
             if not is_valid:
@@ -16,10 +16,12 @@
 # pymwp. If not, see <https://www.gnu.org/licenses/>.
 # -----------------------------------------------------------------------------
 
+import hashlib
 import json
 import logging
 import os
 import re
+from typing import Any
 
 from . import Result
 
@@ -76,6 +78,40 @@ def default_file_out(input_file: str) -> str:
     return os.path.join("output", f"{file_name}.json")
 
 
+def cache_dir() -> str:
+    """Get directory where cached analysis results are stored.
+
+    Uses `$XDG_CACHE_HOME/pymwp` when the variable is set and
+    `~/.cache/pymwp` otherwise.
+
+    Returns:
+        Path to cache directory.
+    """
+    base = os.environ.get('XDG_CACHE_HOME') or \
+        os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'pymwp')
+
+
+def cache_key(input_file: str, *options: Any) -> str:
+    """Compute a content-addressed key for an analysis run.
+
+    The key changes whenever the input file contents, or any of the
+    options that affect the analysis result, change.
+
+    Arguments:
+        input_file: Path to input file.
+        options: Analysis options to include in the key.
+
+    Returns:
+        Hex digest identifying the analysis run.
+    """
+    digest = hashlib.sha256()
+    with open(input_file, 'rb') as fp:
+        digest.update(fp.read())
+    digest.update(repr(options).encode())
+    return digest.hexdigest()
+
+
 def save_result(file_name: str, analysis_result: Result) -> None:
     """Save analysis result to file as JSON.
 
@@ -101,7 +137,7 @@ def save_result(file_name: str, analysis_result: Result) -> None:
     with open(file_name, "w") as outfile:
         json.dump(file_content, outfile, indent=4)
 
-    logger.info(f'saved result in {file_name}')
+    logger.info('saved result in %s', file_name)
 
 
 def load_result(file_name: str) -> Result:
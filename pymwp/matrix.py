@@ -61,7 +61,7 @@ def init_matrix(size: int, init_value: Optional[Any] = None) -> List[list]:
         Initialized matrix.
     """
     value = init_value if init_value is not None else ZERO
-    return [[value for _ in range(size)] for _ in range(size)]
+    return [[value] * size for _ in range(size)]
 
 
 def identity_matrix(size: int) -> List[list]:
@@ -90,8 +90,10 @@ def identity_matrix(size: int) -> List[list]:
     Returns:
         New identity matrix.
     """
-    return [[UNIT if i == j else ZERO
-             for j in range(size)] for i in range(size)]
+    matrix = init_matrix(size)
+    for i in range(size):
+        matrix[i][i] = UNIT
+    return matrix
 
 
 def encode(matrix: MATRIX) -> List[List[List[dict]]]:
@@ -50,6 +50,8 @@ class Monomial:
         deltas (List[DELTA]): List of deltas.
     """
 
+    __slots__ = ('scalar', 'deltas')
+
     def __init__(self, scalar: str = UNIT_MWP,
                  deltas: Optional[Union[List[DELTA], DELTA]] = None,
                  *args: Optional[DELTA]):
@@ -114,8 +116,11 @@ class Monomial:
         Returns:
             False if one delta of m not in self, True otherwise.
         """
+        deltas = self.deltas
+        if len(m.deltas) > len(deltas):
+            return False
         for b in m.deltas:
-            if b not in self.deltas:
+            if b not in deltas:
                 return False
         return True
 
@@ -129,20 +134,15 @@ class Monomial:
             CONTAINS if self contains monomial, INCLUDED if self is included
                 in monomial, and EMPTY none of them.
         """
-        # self contains monomial ?
-        contains: bool = self.contains(monomial)
-
+        # compare scalars first: it is cheaper than comparing deltas
         summ = sum_mwp(self.scalar, monomial.scalar)
         # if self contains monomial and self.scalar >= monomial.scalar
-        if contains and (monomial.scalar == summ):
+        if monomial.scalar == summ and self.contains(monomial):
             return SetInclusion.CONTAINS
-        else:
-            # self included in monomial and self.scalar <= monomial.scalar
-            included: bool = monomial.contains(self)
-            if included and (self.scalar == summ):
-                return SetInclusion.INCLUDED
-            else:
-                return SetInclusion.EMPTY
+        # self included in monomial and self.scalar <= monomial.scalar
+        if self.scalar == summ and monomial.contains(self):
+            return SetInclusion.INCLUDED
+        return SetInclusion.EMPTY
 
     def prod(self, monomial: Monomial) -> Monomial:
         """Prod combines two monomials where one is this monomial (self)
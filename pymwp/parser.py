@@ -19,6 +19,7 @@
 from __future__ import annotations
 import os
 import re
+import shlex
 import tempfile
 from abc import ABC, abstractmethod
 from logging import getLogger
@@ -26,7 +27,7 @@ from logging import getLogger
 from typing import Any, List, Type, Union
 
 # noinspection PyProtectedMember
-from pycparser import c_ast, parse_file, c_generator
+from pycparser import c_ast, c_parser, parse_file, c_generator
 from pycparser_fake_libc import directory as fake_libc_dir
 
 logger = getLogger(__name__)
@@ -317,15 +318,40 @@ class ParserInterface(Nodes):  # pragma: no cover
 class PyCParser(ParserInterface):
     """Implementation of the parser interface using pycparser."""
 
+    __COMMENTS = re.compile(
+        r'//.*?$|/\*.*?\*/|\'(?:\\.|[^\\\'])*\'|"(?:\\.|[^\\"])*"',
+        re.DOTALL | re.MULTILINE)
+    __MACRO = re.compile(r'\b__[A-Z][A-Z0-9_]*__\b')
+
     @staticmethod
-    def parse(file_name: str, headers: List[str] = None, **kwargs):
+    def parse(file_name: str, headers: List[str] = None,
+              auto_cpp: bool = False, **kwargs):
+        """Parse a C file.
+
+        Arguments:
+            file_name: C file to parse.
+            headers: Additional include directories for the preprocessor.
+            auto_cpp: When the preprocessor is enabled, skip it if the
+                source does not need it (see `needs_cpp`). Off by
+                default, because cpp may still rewrite identifiers that
+                happen to be predefined macros.
+
+        Keyword Arguments:
+            use_cpp, cpp_path, cpp_args: as in pycparser `parse_file`.
+
+        Returns:
+            Parsed AST.
+        """
 
         # build parser cpp arguments
         # always append -E and fake_libc args when C preprocessor
         # is enabled
+        user_args = []
         if kwargs.get('use_cpp', False):
-            args = kwargs.get('cpp_args', None)
-            args = args.split(' ') if args else []
+            args = kwargs.get('cpp_args', None) or []
+            args = shlex.split(args) if isinstance(args, str) \
+                else list(args)
+            user_args = [a for a in args if a != '-E']
             if '-E' not in args:
                 args.append(r'-E')
             args.append(r'-I' + fake_libc_dir)
@@ -333,7 +359,7 @@ class PyCParser(ParserInterface):
                 for h in headers:
                     args.append(r'-I' + h)
             kwargs['cpp_args'] = args
-        logger.debug(f'parser arguments: {kwargs}')
+        logger.debug('parser arguments: %s', kwargs)
 
         # if running windows there is no automated fix for you, boo hoo
         # add headers manually
@@ -349,6 +375,22 @@ class PyCParser(ParserInterface):
         with open(file_name, "r+") as cfile:
             c_prog = cfile.read()
 
+        # without the preprocessor pycparser cannot handle comments, nor
+        # the directive inserted by add_attr_x: parse the source directly,
+        # with comments removed
+        if not kwargs.get('use_cpp', False):
+            logger.debug('parsing without C preprocessor')
+            return c_parser.CParser().parse(
+                PyCParser.strip_comments(c_prog), file_name)
+
+        # without directives, and without user arguments such as macro
+        # definitions (-D), the preprocessor only removes comments, which
+        # is cheaper to do here than in a cpp subprocess
+        if auto_cpp and not (user_args or PyCParser.needs_cpp(c_prog)):
+            logger.debug('C preprocessor not needed')
+            return c_parser.CParser().parse(
+                PyCParser.strip_comments(c_prog), file_name)
+
         # apply preprocessing steps
         preprocessed = PyCParser.add_attr_x(c_prog)
         # convert to byte string
@@ -394,6 +436,38 @@ class PyCParser(ParserInterface):
         """Loop type."""
         return Type[Union[Parser.While, Parser.DoWhile, Parser.For]]
 
+    @staticmethod
+    def needs_cpp(text: str) -> bool:
+        """Determine if C program requires running the C preprocessor.
+
+        Arguments:
+            text: C program file content as a string
+
+        Returns:
+            True if program contains directives, line continuations,
+                attributes or predefined macros such as `__LINE__`;
+                False otherwise.
+        """
+        return '#' in PyCParser.strip_comments(text) or \
+            '\\\n' in text or '__attribute__' in text or \
+            PyCParser.__MACRO.search(text) is not None
+
+    @staticmethod
+    def strip_comments(text: str) -> str:
+        """Remove C-style comments, keeping line numbering intact.
+
+        Arguments:
+            text: C program file content as a string
+
+        Returns:
+            contents of C file, without comments.
+        """
+        def replacer(match) -> str:
+            s = match.group(0)
+            return ' ' + '\n' * s.count('\n') if s.startswith('/') else s
+
+        return PyCParser.__COMMENTS.sub(replacer, text)
+
     @staticmethod
     def add_attr_x(text: str) -> str:
         """Conditionally add `#define __attribute__(x)` to C file
@@ -414,7 +488,7 @@ class PyCParser(ParserInterface):
         if not_found:
             lines.insert(0, attr_x)
             text = '\n'.join(lines)
-            logger.debug(f'inserted {attr_x}')
+            logger.debug('inserted %s', attr_x)
         return text
 
     @property
@@ -22,6 +22,8 @@ from __future__ import annotations
 
 import logging
 from functools import reduce
+from heapq import heapify, heappop, heappush
+from operator import itemgetter
 from typing import Optional, List, Tuple, Union
 
 from . import DELTAS, Monomial
@@ -52,6 +54,8 @@ class Polynomial:
          list (List[Monomial]): List of monomials.
     """
 
+    __slots__ = ('list',)
+
     def __init__(
             self,
             *monomials: Optional[Union[str, Monomial, Tuple[str, DELTAS]]]
@@ -123,20 +127,25 @@ class Polynomial:
             False if mono already in list_monom and shifted index where to
                 insert mono, return True if mono not in list_monom.
         """
+        # deltas of a monomial are distinct, so hashed set tests give the
+        # same answer as Monomial.contains without rescanning mono.deltas
+        scalar, deltas = mono.scalar, set(mono.deltas)
+        size = len(deltas)
         j = 0
         while j < len(list_monom):
             m = list_monom[j]
-            incl = m.inclusion(mono)
+            summ = sum_mwp(m.scalar, scalar)
             # if m ⊆ mono
-            if incl == SetInclusion.CONTAINS:
+            if scalar == summ and len(m.deltas) >= size and \
+                    deltas.issubset(m.deltas):
                 # We will then add mono so we can remove m
-                list_monom.remove(m)
+                del list_monom[j]
                 # If removed monom is before i (where we want to insert mono)
                 if j < i:
                     i = i - 1  # shift left position
                 continue
-            elif incl == SetInclusion.INCLUDED:
-                # We don't want to add mono, inform with CONTAINS
+            # mono ⊆ m: we don't want to add mono, inform with CONTAINS
+            if m.scalar == summ and deltas.issuperset(m.deltas):
                 return False, i
             j = j + 1
         # No inclusion
@@ -167,7 +176,9 @@ class Polynomial:
             return self.copy()
 
         i, j = 0, 0
-        new_list = self.copy().list
+        # share the monomials of self; one is copied only when its
+        # scalar changes (copy-on-write)
+        new_list = list(self.list)
         # self_len = len(new_list)
         poly_len = len(polynomial.list)
 
@@ -208,6 +219,7 @@ class Polynomial:
             # when both list heads are the same
             # recompute scalar and move to next element
             else:
+                new_list[i] = mono1.copy()
                 new_list[i].scalar = sum_mwp(mono1.scalar, mono2.scalar)
                 j = j + 1
 
@@ -222,14 +234,15 @@ class Polynomial:
 
         This operation works as follows:
 
-        1. We compute a table of all the separated products
+        1. We set up a table of all the separated products
             $P.m_1,...,P.m_n$. Each of the elements is itself
-            a sorted list of monomials: $P.m_j=m^j_1,...,m^j_k$
+            a sorted list of monomials: $P.m_j=m^j_1,...,m^j_k$,
+            computed lazily, one monomial at a time.
 
-        2. We then sort the list of the first (smallest) elements
-            of each list. I.e. we sort the list $m^1_1,m^2_1,...,m^n_1$
-            and produce the list corresponding list of indexes of
-            length n, I.e. a permutation over ${0,...,n}$.
+        2. We then order the first (smallest) elements of each list,
+            $m^1_1,m^2_1,...,m^n_1$, in a priority queue of indexes
+            ${0,...,n}$; indexes with equal first elements leave the
+            queue in the order they entered it.
 
         3. Once all this preparatory operations are done, the main part
            of the algorithm goes as follows:
@@ -238,19 +251,13 @@ class Polynomial:
            and append to the result the first element of the corresponding
            list $P.m_j$ of monomials.
 
-        5. We remove both the first element of the list of index and
-           the first element of $P.m_j$.
+        5. We remove j from the queue and advance past the first
+           element of $P.m_j$.
 
-        6. If $P.m_j$ is not empty, we insert j in the list of index
-           at the right position: for this we compare the (new) first
-           element of $P.m_j$ to  $m^{i_2}_1$ (as we removed the
-           first element, $i_2$ is now the head of the list of indexes),
-           then $m^{i_3}_1$, until we reach the index h such that
-           $m^{i_h}_1$ is larger than $m^{j}_1$.
+        6. If $P.m_j$ is not exhausted, we put j back in the queue,
+           ordered by the (new) first element of $P.m_j$.
 
-        7. We start back at point 4. Unless only one element is left
-           in the list of indexes. In this case, we simply append the
-           tail of the corresponding list to the result.
+        7. We start back at point 4, until the queue is empty.
 
         Arguments:
             polynomial: polynomial to multiply with self.
@@ -260,55 +267,50 @@ class Polynomial:
                 polynomials.
         """
 
-        # 1: compute table of products
-        # here we compute P1 x P2 for each polynomial, excluding from the
-        # result all monomials that have scalar value 0
-        products = [[mono for mono in (m1 * m2 for m1 in self.list)
-                     if mono.scalar != ZERO_MWP] for m2 in polynomial.list]
-        # filter out empty monomials
-        table: List[List[Monomial]] = [p for p in products if p]
+        # 1: compute the table of products lazily: each row yields
+        # P1 x m2 one monomial at a time, skipping products with scalar 0,
+        # so the table is never materialized
+        def row(m2: Monomial):
+            for m1 in self.list:
+                mono = m1 * m2
+                if mono.scalar != ZERO_MWP:
+                    yield mono
+
+        rows = [row(m2) for m2 in polynomial.list]
+
+        # 2: create a queue of table rows, ordered by deltas of first
+        # monomials; entries are (key, order, index) where order keeps
+        # equal keys first-in first-out, and heads holds the current
+        # first monomial of each row; empty rows never enter the queue
+        heads = [next(r, None) for r in rows]
+        queue = [(Polynomial.sort_key(head.deltas), i, i)
+                 for i, head in enumerate(heads) if head is not None]
 
         # if table is empty, return zero polynomial
-        if not table:
+        if not queue:
             return Polynomial()
 
-        # 2: create an index lists that represents the ordered
-        # monomials in table, ordered by deltas of first monomials
-        index_list = [0]
-        for i in range(1, len(table)):
-            t1 = table[i][0].deltas
-            for j in range(len(index_list)):
-                t2 = table[index_list[j]][0].deltas
-                if Polynomial.compare(t1, t2) == Comparison.SMALLER:
-                    index_list.insert(j, i)
-                    break
-            if i not in index_list:
-                index_list.append(i)
+        heapify(queue)
+        order = len(rows)
 
         # 3: start main part
         result = []
-        while index_list:
+        while queue:
             # 4. get first element and append to result
-            # 5. remove from index and table
-            smallest = index_list.pop(0)
-            mono2 = table[smallest].pop(0)
+            # 5. remove from queue and advance in table
+            _, _, smallest = heappop(queue)
+            mono2 = heads[smallest]
             tobe_inserted, _ = Polynomial.inclusion(result, mono2)
             if tobe_inserted:
                 result.append(mono2)
 
-            # 6. when table is non-empty insert j at
-            # the right index
-            if table[smallest]:
-                inserted = False
-                t1 = table[smallest][0].deltas
-                for j in range(len(index_list)):
-                    t2 = table[index_list[j]][0].deltas
-                    if Polynomial.compare(t1, t2) == Comparison.SMALLER:
-                        index_list.insert(j, smallest)
-                        inserted = True
-                        break
-                if not inserted:
-                    index_list.append(smallest)
+            # 6. when row is not exhausted, put it back in the queue
+            head = next(rows[smallest], None)
+            if head is not None:
+                heads[smallest] = head
+                heappush(queue, (Polynomial.sort_key(
+                    head.deltas), order, smallest))
+                order += 1
             # 7. repeat until done
 
         return Polynomial(*result).remove_zeros()
@@ -332,17 +334,17 @@ class Polynomial:
         """
         p1, p2 = self.list, polynomial.list
 
+        # polynomials of different length cannot be equal
+        if len(p1) != len(p2):
+            return False
+
         # the only times deltas are equal is if they contain
         # same values and are equal in length; avoid calling
         # compare because it is more expensive method call; we
-        # can do faster equality comparison on deltas this way
-        same = [m1.scalar == m2.scalar and m1.deltas == m2.deltas
-                for m1, m2 in zip(p1, p2)]
-
-        # if False is in list it means some comparison of
-        # deltas was determined not to be equal; do length
-        # comparison last because it is almost never False
-        return False not in same and len(p1) == len(p2)
+        # can do faster equality comparison on deltas this way,
+        # stopping at the first monomial that differs
+        return all(m1.scalar == m2.scalar and m1.deltas == m2.deltas
+                   for m1, m2 in zip(p1, p2))
 
     def copy(self) -> Polynomial:
         """Make a deep copy of polynomial."""
@@ -403,20 +405,12 @@ class Polynomial:
         Returns:
             Result of comparison.
         """
-        # element wise comparison up to length of shorter list
-        list_diff = [(a == b) for a, b in zip(delta_list1, delta_list2)]
-
-        # if some difference exists
-        if False in list_diff:
-
-            # index of first difference
-            idx = list_diff.index(False)
-
-            (i, j), (m, n) = delta_list1[idx], delta_list2[idx]
-
-            if (j < n) or (j == n and i < m):
-                return Comparison.SMALLER
-            else:
+        # element wise comparison up to length of shorter list,
+        # the first difference decides
+        for (i, j), (m, n) in zip(delta_list1, delta_list2):
+            if i != m or j != n:
+                if (j < n) or (j == n and i < m):
+                    return Comparison.SMALLER
                 return Comparison.LARGER
 
         # If the list coincide on their initial segment up to "max",
@@ -431,21 +425,34 @@ class Polynomial:
         else:
             return Comparison.EQUAL
 
+    @staticmethod
+    def sort_key(deltas: DELTAS) -> Tuple[Tuple[int, int], ...]:
+        """Sort key of a list of deltas.
+
+        Keys of two lists of deltas are ordered the same way as
+        [`compare`](polynomial.md#pymwp.polynomial.Polynomial.compare)
+        orders the lists: delta $(i,j)$ maps to $(j,i)$, and tuples
+        compare element-wise, then by length.
+
+        Arguments:
+            deltas: list of deltas.
+
+        Returns:
+            Sort key of the deltas.
+        """
+        return tuple([(j, i) for i, j in deltas])
+
     @staticmethod
     def sort_monomials(monomials: list) -> list:
         """Given a list of monomials this method will return them in order.
 
-        The sort is performed by first dividing the list of monomials into
-        halves recursively until each half contains at most one monomial.
-        Then the sort will begin to combine (or zip) the halves into a sorted
-        list.
-
-        The sort performs comparison of deltas, and orders the monomials based
-        on the delta values. If two monomials have the same deltas, we compute
-        new scalar value, and if it is not 0, we keep the result monomial.
-        Note that if we get 2 monomials with same deltas, and only at most 1
-        is kept, with possibly updated scalar. This means sort can return a
-        result that is shorter than the input argument.
+        The monomials are ordered by their deltas, see
+        [`sort_key`](polynomial.md#pymwp.polynomial.Polynomial.sort_key).
+        If two monomials have the same deltas, we compute new scalar value,
+        and if it is not 0, we keep the result monomial. Note that if we get
+        2 monomials with same deltas, only at most 1 is kept, with possibly
+        updated scalar. This means sort can return a result that is shorter
+        than the input argument.
 
         The original list argument is not mutated by this sort operation, i.e.
         this is not sort in place.
@@ -456,53 +463,23 @@ class Polynomial:
         Returns:
             list of sorted monomials.
         """
-        list_len = len(monomials)
-
-        # base case
-        if list_len < 2:
-            if monomials and monomials[0] == ZERO_MWP:
-                return []
-            return monomials
-
-        # split list into two halves equally
-        mid_point = list_len // 2
-        left = Polynomial.sort_monomials(monomials[mid_point:])
-        right = Polynomial.sort_monomials(monomials[:mid_point])
-
-        # construct sorted list by iteratively combining
-        # monomials from left and right halves
-        new_list = []
-        while left and right:
-            lhead, *ltail = left
-            rhead, *rtail = right
-            comparison = Polynomial.compare(lhead.deltas, rhead.deltas)
-
-            # head of left list is smaller -> add it to list
-            if comparison == Comparison.SMALLER:
-                new_list.append(lhead)
-                left = ltail
-
-            # head of right list is smaller -> add it to list
-            if comparison == Comparison.LARGER:
-                new_list.append(rhead)
-                right = rtail
-
-            # list heads are equal i.e. same deltas.
-            if comparison == Comparison.EQUAL:
-                monomial = lhead
-                # append to list as long as scalar
-                # product is not 0
-                monomial.scalar = sum_mwp(
-                    lhead.scalar, rhead.scalar)
-                if monomial.scalar != ZERO_MWP:
-                    new_list.append(monomial)
-                left = ltail
-                right = rtail
-
-        # either left or right is empty so order
-        # doesn't matter; just append whatever
-        # remains of left or right tail
-        return new_list + right + left
+        new_list, keys, merged = [], [], []
+        for key, monomial in sorted(
+                ((Polynomial.sort_key(m.deltas), m) for m in monomials),
+                key=itemgetter(0)):
+            # same deltas: keep one monomial, with the sum of scalars
+            if keys and keys[-1] == key:
+                scalar = sum_mwp(new_list[-1].scalar, monomial.scalar)
+                monomial = monomial.copy()
+                monomial.scalar = scalar
+                new_list[-1], merged[-1] = monomial, True
+            else:
+                new_list.append(monomial)
+                keys.append(key)
+                merged.append(False)
+        # drop monomials whose summed scalar is 0
+        return [mono for mono, summed in zip(new_list, merged)
+                if not (summed and mono.scalar == ZERO_MWP)]
 
     def remove_zeros(self) -> Polynomial:
         """Removes all encountered 0s from a polynomial.
@@ -548,6 +525,9 @@ class Polynomial:
              Generated polynomial.
          """
 
-        monomials = [Monomial(scalar, (number, index))
-                     for number, scalar in enumerate(scalars)]
+        # each monomial has exactly one delta, so it can be set directly
+        # instead of going through sorted delta insertion
+        monomials = [Monomial(scalar) for scalar in scalars]
+        for number, mono in enumerate(monomials):
+            mono.deltas = [(number, index)]
         return Polynomial(*monomials)
@@ -25,7 +25,7 @@ from typing import Optional, Tuple, List, Dict, Union
 
 from . import Choices, DeltaGraph, Polynomial, MATRIX
 from . import matrix as matrix_utils
-from .semiring import UNIT_MWP, ZERO_MWP
+from .semiring import UNIT_MWP, ZERO_MWP, INFTY_MWP
 
 logger = logging.getLogger(__name__)
 
@@ -297,14 +297,14 @@ class Relation:
         fix = Relation(fix_vars, matrix)
         prev_fix = Relation(fix_vars, matrix)
         current = Relation(fix_vars, matrix)
-        logger.debug(f"computing fixpoint for variables {fix_vars}")
+        logger.debug("computing fixpoint for variables %s", fix_vars)
 
         while True:
             prev_fix.matrix = fix.matrix
             current = current * self
             fix = fix + current
             if fix.equal(prev_fix):
-                logger.debug(f"fixpoint done {fix_vars}")
+                logger.debug("fixpoint done %s", fix_vars)
                 return fix
 
     def apply_choice(self, *choices: int) -> SimpleRelation:
@@ -464,6 +464,43 @@ class Relation:
             result[v_name] = Choices.generate(choices, index, d)
         return result[variables] if one_var else result
 
+    def classify_var(self, choices: List[int], index: int, v_name: str,
+                     filters: List[Tuple[str, ...]]) \
+            -> Optional[Tuple[int, Choices]]:
+        """Evaluate a variable against a sequence of scalar filters.
+
+        This is the same as calling `var_eval` once per filter, and
+        stopping at the first result that is not infinite, except that
+        the variable column is traversed only once, and a filter that
+        excludes no additional deltas is not re-evaluated.
+
+        Arguments:
+            choices: List of choices at each index, `[0,1,2]`
+            index: Accumulated program counter.
+            v_name: Variable to evaluate.
+            filters: Excluded scalars, in order of preference.
+
+        Returns:
+            Position of the first satisfiable filter and its choices,
+            or None if every filter leads to infinity.
+        """
+        col, buckets = self.variables.index(v_name), {}
+        for row in self.matrix:
+            for mono in row[col].list:
+                buckets.setdefault(mono.scalar, set()) \
+                    .add(tuple(mono.deltas))
+        tried = []
+        for pos, scalars in enumerate(filters):
+            d = set().union(*(buckets.get(s, ()) for s in
+                              set(scalars + (INFTY_MWP,))))
+            if d in tried:
+                continue
+            tried.append(d)
+            result = Choices.generate(choices, index, d)
+            if not result.infinite:
+                return pos, result
+        return None
+
 
 class SimpleRelation(Relation):
     """Specialized instance of relation, where matrix contains only
@@ -38,6 +38,8 @@ class Timeable:
         end_time (int): recorded end time.
     """
 
+    __slots__ = ('start_time', 'end_time')
+
     def __init__(self):
         self.start_time = 0
         self.end_time = 0
@@ -72,6 +74,8 @@ class Serializable(ABC):
     """General utilities for converting results to JSON-writable
     objects and vice versa."""
 
+    __slots__ = ()
+
     @property
     def _attrs(self) -> List[str]:
         """List of simple attribute names."""
@@ -219,6 +223,9 @@ class FuncResult(Timeable, Serializable):
         func_code (str): Function source code.
     """
 
+    __slots__ = ('name', 'infinite', 'variables', 'relation', 'choices',
+                 'bound', 'inf_flows', 'index', 'func_code')
+
     def __init__(self, name: str, infinite: bool = False,
                  variables: Optional[List[str]] = None,
                  relation: Optional[Relation] = None,
@@ -346,6 +353,8 @@ class LoopResult(Timeable, Serializable):
         variables (Dict[str, VResult]): Results by variable.
     """
 
+    __slots__ = ('loop_code', 'variables')
+
     def __init__(self, loop_code: str = None):
         super().__init__()
         self.loop_code: str = loop_code
@@ -610,7 +619,7 @@ class Result(Timeable, Serializable):
                 # format line and append
                 lines += [f' {part:<{line_w}}']
         parts = '\n'.join([top_bar, '\n'.join(lines), bot_bar])
-        logger.info(f'\n{color}{parts}{endc}')
+        logger.info('\n%s%s%s', color, parts, endc)
         return parts
 
     def get_func(self, name: Optional[str] = None) \
@@ -652,7 +661,7 @@ class Result(Timeable, Serializable):
         """Display here all interesting stats about analysis result."""
         if self.n_functions == 0 and self.n_loops == 0:
             logger.warning("Nothing was analyzed")
-        logger.info(f'Total time: {self.dur_s} s ({self.dur_ms} ms)')
+        logger.info('Total time: %s s (%s ms)', self.dur_s, self.dur_ms)
         return self
 
     @staticmethod
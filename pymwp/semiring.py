@@ -89,9 +89,9 @@ def prod_mwp(scalar1: str, scalar2: str) -> str:
     Returns:
         Product of scalar1 * scalar2.
     """
-    if scalar1 in KEYS and scalar2 in KEYS:
+    try:
         return __DICT_PROD[scalar1][scalar2]
-    else:
+    except (KeyError, TypeError):
         raise Exception(
             f"trying to use {scalar1} and {scalar2} as keys for prod…")
 
@@ -117,8 +117,8 @@ def sum_mwp(scalar1: str, scalar2: str) -> str:
     Returns:
         Sum of scalar1 + scalar2.
     """
-    if scalar1 in KEYS and scalar2 in KEYS:
+    try:
         return __DICT_SUM[scalar1][scalar2]
-    else:
+    except (KeyError, TypeError):
         raise Exception(
             f"trying to use {scalar1} and {scalar2} as keys for sum…")
@@ -132,11 +132,11 @@ class SyntaxUtils:
         """
         n = len(omits)
         if n == 1:
-            logger.debug(f'Unsupported syntax: {omits[0]}')
+            logger.debug('Unsupported syntax: %s', omits[0])
         elif n > 1:
             codes = [(cnt, code) for (code, cnt) in Counter(omits).items()]
             codes = sorted(codes, key=lambda x: (-x[0], x[1]))
-            logger.debug(f'Unsupported syntax {n}x, {len(codes)} unique')
+            logger.debug('Unsupported syntax %dx, %d unique', n, len(codes))
             for i, cv in enumerate(codes):
                 logger.debug(SyntaxUtils._fmt(i, *cv))
 
@@ -174,12 +174,12 @@ class BaseAnalysis(NodeHandler):
     PLUS, MINUS, MULT = '+', '-', '*'
     NEG, SIZEOF = '!', 'sizeof'
 
-    BIN_OPS = {PLUS, MINUS, MULT}
+    BIN_OPS = frozenset({PLUS, MINUS, MULT})
     """Supported binary operators."""
 
-    SIGN = {'+', '-'}
-    PREFIX = {'++', '--'}
-    INC, DEC = {'p++', '++'}, {'p--', '--'}
+    SIGN = frozenset({'+', '-'})
+    PREFIX = frozenset({'++', '--'})
+    INC, DEC = frozenset({'p++', '++'}), frozenset({'p--', '--'})
     INC_DEC = INC | DEC
     U_OPS = INC | DEC | {PLUS, MINUS, NEG, SIZEOF}
     """Supported unary operators."""
@@ -279,7 +279,7 @@ class Coverage(BaseAnalysis):
         assert (n == len(self.clear_list))
         [callable_() for callable_ in self.clear_list]
         self.omit, self.clear_list = [], []
-        logger.debug(f"Removed unsupported syntax: {n} node(s)")
+        logger.debug("Removed unsupported syntax: %d node(s)", n)
         return self
 
     @staticmethod
@@ -301,11 +301,11 @@ class Coverage(BaseAnalysis):
         """
         loop_x, body = Variables.loop_guard(node)
         if len(loop_x) != 1:  # exactly one guard variable
-            logger.debug(f"Unknown loop guard variable in {loop_x}")
+            logger.debug("Unknown loop guard variable in %s", loop_x)
             return False, None
         x_var = loop_x[0]
         if x_var in body:
-            logger.warning(f"Variable {x_var} occurs in loop body")
+            logger.warning("Variable %s occurs in loop body", x_var)
             return False, None
         return True, x_var
 
@@ -470,7 +470,7 @@ class Variables(BaseAnalysis):
 
         info = [('guard', loop_x), ('body', body)]
         info = [f"{lbl}: {' '.join(v) or '?'}" for lbl, v in info]
-        logger.debug(f"for-loop {', '.join(info)}")
+        logger.debug("for-loop %s", ', '.join(info))
         return loop_x, body
 
     def handler(self, node: pr.Node, *args, **kwargs):
@@ -2,7 +2,11 @@ from copy import deepcopy
 
 from pymwp import Analysis, Polynomial, Bound
 from pymwp.semiring import KEYS
-from .mocks.ast_mocks import *
+from .mocks.ast_mocks import (
+    BRACES_ISSUES, EMPTY, EMPTY_FUNCTION, FOR_LOOP, FOR_SUBST,
+    FUNCTION_CALL, IF_EMPTY_BRACES, IF_WITH_BRACES, IF_WO_BRACES,
+    INFINITE_2, INFINITE_8, NOT_INFINITE_2, NOT_INFINITE_3, PARAMS,
+    TYPEDEFS, UNARY_EQ, UNARY_OPS, VARIABLE_IGNORED, VAR_TESTS)
 
 o, m, w, p = KEYS[:4]
 
@@ -226,3 +230,14 @@ def test_unary_ops():
     other = Analysis.run(deepcopy(UNARY_EQ), strict=True).get_func()
     assert result.n_vars == other.n_vars == 2
     assert result.n_bounds == other.n_bounds == 2187
+
+
+def test_analyze_functions_in_parallel():
+    """Analyzing functions in worker processes gives the same result."""
+    expected = Analysis.run(deepcopy(VAR_TESTS))
+    result = Analysis.run(deepcopy(VAR_TESTS), workers=2)
+
+    assert list(result.relations) == list(expected.relations)
+    for name, func in result.relations.items():
+        assert func.infinite == expected.relations[name].infinite
+        assert func.bound == expected.relations[name].bound
@@ -70,3 +70,14 @@ def test_compare_diff_larger_when_j_greater_than_n():
     m1 = [(0, 1)]
     m2 = [(0, 0)]
     assert Polynomial.compare(m1, m2) == Comparison.LARGER
+
+
+def test_sort_key_orders_like_compare():
+    deltas = [[], [(0, 0)], [(1, 0)], [(0, 1)], [(0, 0), (1, 1)],
+              [(0, 0), (0, 1)], [(1, 0), (0, 1)], [(2, 0), (0, 1), (1, 3)]]
+    for d1 in deltas:
+        for d2 in deltas:
+            k1, k2 = Polynomial.sort_key(d1), Polynomial.sort_key(d2)
+            expected = (Comparison.SMALLER if k1 < k2 else
+                        Comparison.LARGER if k1 > k2 else Comparison.EQUAL)
+            assert Polynomial.compare(d1, d2) == expected
@@ -2,7 +2,9 @@ import logging
 from copy import deepcopy
 
 from pymwp import Coverage, Parser as pr
-from .mocks.ast_mocks import *
+from .mocks.ast_mocks import (
+    CASTS, FOR_BODY, FOR_INVALID, FUNCTION_CALL, IF_INVALID_TESTS,
+    INFINITE_2, SINGLE_LINK_CLUSTER, VAR_TESTS, VERIFICATION)
 
 
 def f(ast, name):
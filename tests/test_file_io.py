@@ -2,7 +2,8 @@ import json
 import os
 
 from pymwp import Relation, Choices, Result
-from pymwp.file_io import default_file_out, save_result, load_result, loc
+from pymwp.file_io import default_file_out, save_result, load_result, loc, \
+    cache_dir, cache_key
 from pymwp.result import FuncResult
 
 
@@ -128,3 +129,22 @@ def test_read_loc(mocker):
     result = loc("some_file.c")
 
     assert result == 4
+
+
+def test_cache_dir_uses_xdg(monkeypatch):
+    """Cache directory is placed under XDG_CACHE_HOME when it is set."""
+    monkeypatch.setenv('XDG_CACHE_HOME', '/my/cache')
+    assert cache_dir() == '/my/cache/pymwp'
+
+
+def test_cache_key_depends_on_content_and_options(tmp_path):
+    """Cache key changes when either file content or options change."""
+    c_file = tmp_path / 'example.c'
+    c_file.write_text('int foo(int x){ return x; }')
+    key = cache_key(str(c_file), 'F', False)
+
+    assert key == cache_key(str(c_file), 'F', False)
+    assert key != cache_key(str(c_file), 'L', False)
+
+    c_file.write_text('int foo(int y){ return y; }')
+    assert key != cache_key(str(c_file), 'F', False)
@@ -1,5 +1,7 @@
 from pymwp import FindLoops, Parser as pr
-from .mocks.ast_mocks import *
+from .mocks.ast_mocks import (
+    FOR_BODY, FOR_INVALID, FOR_LOOP, INFINITE_8, SINGLE_LINK_CLUSTER,
+    VAR_TESTS)
 
 
 def f(ast, name):
@@ -1,5 +1,6 @@
 from pymwp import LoopAnalysis
-from .mocks.ast_mocks import *
+from .mocks.ast_mocks import (
+    FOR_SUBST, INFINITE_8, NOT_INFINITE_3, SINGLE_LINK_CLUSTER)
 
 
 def test_single_link_loop_analysis():
@@ -40,3 +41,15 @@ def test_for_subst_loop_analysis():
     assert loop.variables['x_'].is_m
     assert loop.variables['x'].is_m
     assert loop.variables['y'].is_p
+
+
+def test_loop_analysis_in_parallel():
+    expected = LoopAnalysis.run(SINGLE_LINK_CLUSTER, strict=True) \
+        .get_func('SingleLinkCluster')
+    result = LoopAnalysis.run(SINGLE_LINK_CLUSTER, strict=True, workers=2) \
+        .get_func('SingleLinkCluster')
+    assert [loop.loop_code for loop in result.loops] == \
+           [loop.loop_code for loop in expected.loops]
+    for loop, exp in zip(result.loops, expected.loops):
+        assert loop.linear == exp.linear
+        assert loop.n_bounded == exp.n_bounded
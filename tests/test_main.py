@@ -0,0 +1,108 @@
+import logging
+import sys
+
+import pytest
+
+from pymwp import __title__
+from pymwp.__main__ import main
+from pymwp.file_io import load_result
+
+
+@pytest.fixture(autouse=True)
+def restore_logger():
+    """main() reconfigures the program logger; undo it after each test."""
+    logger = logging.getLogger(__title__)
+    level, handlers = logger.level, logger.handlers[:]
+    yield
+    logger.setLevel(level)
+    logger.handlers[:] = handlers
+
+
+def run_main(monkeypatch, tmp_path, *args):
+    monkeypatch.setattr(sys, 'argv', ['pymwp', *args])
+    monkeypatch.chdir(tmp_path)
+    main()
+
+
+def test_same_output_name_is_rejected(monkeypatch, tmp_path):
+    """Files with the same name in different directories would be
+    saved to the same output file, so they are rejected."""
+    for d in ('a', 'b'):
+        (tmp_path / d).mkdir()
+        (tmp_path / d / 'foo.c').write_text('int foo(){ return 0; }')
+    args = [str(tmp_path / 'a' / 'foo.c'), str(tmp_path / 'b' / 'foo.c')]
+
+    with pytest.raises(SystemExit) as exit_info:
+        run_main(monkeypatch, tmp_path, *args)
+    assert exit_info.value.code == 2
+    assert not (tmp_path / 'output').exists()
+
+
+@pytest.mark.parametrize('option', [['--out', 'res.json'],
+                                    ['--workers', '2']])
+def test_option_with_multiple_files_is_rejected(
+        monkeypatch, tmp_path, option):
+    for name in ('foo.c', 'bar.c'):
+        (tmp_path / name).write_text('int foo(){ return 0; }')
+
+    with pytest.raises(SystemExit) as exit_info:
+        run_main(monkeypatch, tmp_path, 'foo.c', 'bar.c', *option)
+    assert exit_info.value.code == 2
+    assert not (tmp_path / 'output').exists()
+    assert not (tmp_path / 'res.json').exists()
+
+
+def test_multiple_files_are_analyzed(monkeypatch, tmp_path):
+    (tmp_path / 'foo.c').write_text('int foo(int x){ x = x + 1; }')
+    (tmp_path / 'bar.c').write_text('int bar(int y){ y = y * 2; }')
+
+    run_main(monkeypatch, tmp_path, 'foo.c', 'bar.c', '--silent')
+    assert (tmp_path / 'output' / 'foo.json').is_file()
+    assert (tmp_path / 'output' / 'bar.json').is_file()
+
+
+def test_failing_file_does_not_stop_others(monkeypatch, tmp_path):
+    (tmp_path / 'foo.c').write_text('int foo(int x){ x = x + 1; }')
+    (tmp_path / 'bad.c').write_text('int bad(int y){ y = ; }')
+
+    with pytest.raises(SystemExit) as exit_info:
+        run_main(monkeypatch, tmp_path, 'foo.c', 'bad.c', '--silent')
+    assert exit_info.value.code == 1
+    assert (tmp_path / 'output' / 'foo.json').is_file()
+    assert not (tmp_path / 'output' / 'bad.json').exists()
+
+
+def cache_files(tmp_path):
+    return list((tmp_path / 'cache' / 'pymwp').glob('*.json'))
+
+
+def test_cache_is_reused(monkeypatch, tmp_path):
+    from pymwp import Analysis
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    (tmp_path / 'foo.c').write_text('int foo(int x){ x = x + 1; }')
+
+    run_main(monkeypatch, tmp_path, 'foo.c', '--silent', '--cache')
+    assert len(cache_files(tmp_path)) == 1
+    first = (tmp_path / 'output' / 'foo.json').read_text()
+
+    def fail(*_, **__):
+        raise AssertionError('analysis should not run')
+
+    monkeypatch.setattr(Analysis, 'run', fail)
+    (tmp_path / 'output' / 'foo.json').unlink()
+    run_main(monkeypatch, tmp_path, 'foo.c', '--silent', '--cache')
+    assert (tmp_path / 'output' / 'foo.json').read_text() == first
+
+
+@pytest.mark.parametrize('content', ['not json', '[]', '{"foo": 1}'])
+def test_unreadable_cache_is_recomputed(monkeypatch, tmp_path, content):
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    (tmp_path / 'foo.c').write_text('int foo(int x){ x = x + 1; }')
+
+    run_main(monkeypatch, tmp_path, 'foo.c', '--silent', '--cache')
+    cache_file, = cache_files(tmp_path)
+    cache_file.write_text(content)
+
+    run_main(monkeypatch, tmp_path, 'foo.c', '--silent', '--cache')
+    assert 'foo' in load_result(str(cache_file)).relations
+    assert 'foo' in load_result('output/foo.json').relations
@@ -79,6 +79,75 @@ def test_ast_structure_func_call():
     assert str(ast) == str(FUNCTION_CALL)
 
 
+def test_ast_structure_without_cpp():
+    """Parsing without preprocessor gives the same AST."""
+    ast = Parser.parse('tests/examples/infinite_2.c', use_cpp=False)
+    assert str(ast) == str(INFINITE_2)
+
+
+def test_no_cpp_parses_source_with_comments(tmp_path):
+    """With the preprocessor disabled (--no_cpp), comments are removed
+    before parsing and no directive is added to the source."""
+    c_file = tmp_path / 'comments.c'
+    c_file.write_text('int foo(int x){\n  /* c */ x = x + 1; // d\n'
+                      '  return x;\n}')
+    ast = Parser.parse(str(c_file), use_cpp=False)
+    assert Parser.to_c(ast.ext[0].body.block_items[0]) == 'x = x + 1'
+    assert ast.ext[0].body.block_items[0].coord.line == 2
+
+
+def test_parse_cpp_args_str_or_list(tmp_path):
+    """Preprocessor arguments can be given as a string or a list."""
+    c_file = tmp_path / 'macro.c'
+    c_file.write_text('#define N 3\nint foo(){ return N; }')
+    for cpp_args in ['-E -DM=1', ['-E', '-DM=1']]:
+        ast = Parser.parse(str(c_file), use_cpp=True, cpp_path='gcc',
+                           cpp_args=cpp_args)
+        assert Parser.to_c(ast.ext[0].body.block_items[0]) == 'return 3;'
+
+
+def test_parse_cpp_args_without_directives(tmp_path):
+    """Macros defined by preprocessor arguments are expanded even when
+    the source itself has no directives."""
+    c_file = tmp_path / 'define.c'
+    c_file.write_text('int foo(int x){ x = x + N; return x; }')
+    ast = Parser.parse(str(c_file), use_cpp=True, cpp_path='gcc',
+                       cpp_args='-E -DN=3')
+    assert Parser.to_c(ast.ext[0].body.block_items[0]) == 'x = x + 3'
+
+
+def test_parse_runs_cpp_by_default(tmp_path):
+    """Predefined macros are expanded even without directives; cpp is
+    only skipped on request, when the source does not need it."""
+    c_file = tmp_path / 'line.c'
+    c_file.write_text('int foo(){\n  int x = __LINE__;\n  return x;\n}')
+    ast = Parser.parse(str(c_file), **PARSER_KWARGS)
+    decl = ast.ext[0].body.block_items[0]
+    assert isinstance(decl.init, Parser.Constant)
+    c_file.write_text('int foo(int x){ /* c */ return x; }')
+    ast = Parser.parse(str(c_file), auto_cpp=True, **PARSER_KWARGS)
+    # not preprocessed: no directive was inserted ahead of line 1
+    assert ast.ext[0].coord.line == 1
+
+
+def test_needs_cpp():
+    """Preprocessor is only needed for directives, continuations and
+    attributes; comments alone do not require it."""
+    assert Parser.needs_cpp('#include <stdio.h>\nint x;')
+    assert Parser.needs_cpp('int x \\\n = 1;')
+    assert Parser.needs_cpp('int x __attribute__((unused));')
+    assert Parser.needs_cpp('int x = __LINE__;')
+    assert not Parser.needs_cpp('/* # */ int x; // #define y')
+    assert not Parser.needs_cpp('int x;')
+
+
+def test_strip_comments_keeps_lines():
+    """Removing comments does not change line numbering."""
+    text = 'int x; /* a\nb */ int y; // c\nchar *s = "//";'
+    assert Parser.strip_comments(text) == \
+           'int x;  \n int y;  \nchar *s = "//";'
+
+
 def test_nodes_and_node_handler_methods_match():
     for nodeT in [n for n in dir(Nodes) if not n.startswith('_')]:
         assert nodeT in dir(NodeHandler)
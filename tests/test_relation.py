@@ -66,3 +66,26 @@ def test_replace_column():
     assert after.matrix[0][0] == after.matrix[2][2] and after.matrix[2][2] != p
     assert after.matrix[1][0] == after.matrix[2][0] == after.matrix[0][2]
     assert after.matrix[0][2] == after.matrix[1][2] and after.matrix[1][2] != p
+
+
+def test_classify_var_matches_var_eval():
+    """Classifying a variable gives the first filter for which var_eval
+    has valid choices."""
+    filters = [('w', 'p'), ('p',), ()]
+    for scalars, expected in ((('m', 'w', 'p'), 0),
+                              (('w', 'w', 'p'), 1),
+                              (('p', 'p', 'p'), 2)):
+        r = Relation(['X0', 'X1'])
+        r.matrix[0][0] = Polynomial.from_scalars(0, *scalars)
+        pos, choices = r.classify_var([0, 1, 2], 1, 'X0', filters)
+        assert pos == expected
+        assert choices.valid == r.var_eval(
+            [0, 1, 2], 1, 'X0', *filters[pos]).valid
+
+
+def test_classify_var_all_infinite():
+    """Classifying a variable that is infinite for every filter gives
+    None."""
+    r = Relation(['X0'])
+    r.matrix[0][0] = Polynomial.from_scalars(0, 'i', 'i', 'i')
+    assert r.classify_var([0, 1, 2], 1, 'X0', [('w', 'p'), ()]) is None
@@ -1,5 +1,5 @@
 from pymwp import Variables, Parser as pr
-from .mocks.ast_mocks import *
+from .mocks.ast_mocks import PARAMS, VARIABLE_IGNORED, VAR_TESTS
 
 
 def f(ast, name):